@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Regenerate ``src/roman_datamodels/_stnode_tables.py`` from the datamodels
+manifest in the installed ``rad`` package. Run this after updating ``rad``
+so that `roman_datamodels.stnode` does not have to derive the node class
+names at import time.
+
+The class names are derived here the same way as by
+``roman_datamodels.stnode._class_name_from_tag_uri``, without importing
+``roman_datamodels`` (which itself reads the generated tables).
+"""
+import sys
+from pathlib import Path
+
+import rad.resources
+import yaml
+
+if sys.version_info < (3, 9):
+    import importlib_resources
+else:
+    import importlib.resources as importlib_resources
+
+HEADER = '''"""
+Tables generated from the rad datamodels manifest by
+``scripts/gen_stnode_tables.py``.  Do not edit by hand.
+"""
+
+'''
+
+MANIFEST = "datamodels-1.0.yaml"
+REFERENCE_FILE_TAG_PREFIX = "asdf://stsci.edu/datamodels/roman/tags/reference_files/"
+
+
+def main():
+    manifest_path = importlib_resources.files(rad.resources) / "manifests" / MANIFEST
+    manifest = yaml.safe_load(manifest_path.read_bytes())
+
+    tables_path = Path(__file__).absolute().parent.parent / "src" / "roman_datamodels" / "_stnode_tables.py"
+
+    lines = ["_TAG_TO_CLASS_NAME = {"]
+    for tag in manifest["tags"]:
+        tag_uri = tag["tag_uri"]
+        tag_name = tag_uri.split("/")[-1].split("-")[0]
+        class_name = "".join([p.capitalize() for p in tag_name.split("_")])
+        if tag_uri.startswith(REFERENCE_FILE_TAG_PREFIX):
+            class_name += "Ref"
+        lines.append(f'    "{tag_uri}": "{class_name}",')
+    lines.append("}")
+
+    with tables_path.open("w") as f:
+        f.write(HEADER + "\n".join(lines) + "\n")
+
+    print(tables_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Tables generated from the rad datamodels manifest by
+``scripts/gen_stnode_tables.py``.  Do not edit by hand.
+"""
+
+_TAG_TO_CLASS_NAME = {
+    "asdf://stsci.edu/datamodels/roman/tags/guidewindow-1.0.0": "Guidewindow",
+    "asdf://stsci.edu/datamodels/roman/tags/ramp-1.0.0": "Ramp",
+    "asdf://stsci.edu/datamodels/roman/tags/ramp_fit_output-1.0.0": "RampFitOutput",
+    "asdf://stsci.edu/datamodels/roman/tags/wfi_science_raw-1.0.0": "WfiScienceRaw",
+    "asdf://stsci.edu/datamodels/roman/tags/wfi_image-1.0.0": "WfiImage",
+    "asdf://stsci.edu/datamodels/roman/tags/wfi_mode-1.0.0": "WfiMode",
+    "asdf://stsci.edu/datamodels/roman/tags/pixelarea-1.0.0": "Pixelarea",
+    "asdf://stsci.edu/datamodels/roman/tags/exposure-1.0.0": "Exposure",
+    "asdf://stsci.edu/datamodels/roman/tags/program-1.0.0": "Program",
+    "asdf://stsci.edu/datamodels/roman/tags/observation-1.0.0": "Observation",
+    "asdf://stsci.edu/datamodels/roman/tags/ephemeris-1.0.0": "Ephemeris",
+    "asdf://stsci.edu/datamodels/roman/tags/visit-1.0.0": "Visit",
+    "asdf://stsci.edu/datamodels/roman/tags/photometry-1.0.0": "Photometry",
+    "asdf://stsci.edu/datamodels/roman/tags/source_detection-1.0.0": "SourceDetection",
+    "asdf://stsci.edu/datamodels/roman/tags/coordinates-1.0.0": "Coordinates",
+    "asdf://stsci.edu/datamodels/roman/tags/aperture-1.0.0": "Aperture",
+    "asdf://stsci.edu/datamodels/roman/tags/pointing-1.0.0": "Pointing",
+    "asdf://stsci.edu/datamodels/roman/tags/target-1.0.0": "Target",
+    "asdf://stsci.edu/datamodels/roman/tags/velocity_aberration-1.0.0": "VelocityAberration",
+    "asdf://stsci.edu/datamodels/roman/tags/wcsinfo-1.0.0": "Wcsinfo",
+    "asdf://stsci.edu/datamodels/roman/tags/guidestar-1.0.0": "Guidestar",
+    "asdf://stsci.edu/datamodels/roman/tags/cal_step-1.0.0": "CalStep",
+    "asdf://stsci.edu/datamodels/roman/tags/reference_files/dark-1.0.0": "DarkRef",
+    "asdf://stsci.edu/datamodels/roman/tags/reference_files/distortion-1.0.0": "DistortionRef",
+    "asdf://stsci.edu/datamodels/roman/tags/reference_files/flat-1.0.0": "FlatRef",
+    "asdf://stsci.edu/datamodels/roman/tags/reference_files/gain-1.0.0": "GainRef",
+    "asdf://stsci.edu/datamodels/roman/tags/reference_files/inverse_linearity-1.0.0": "InverseLinearityRef",
+    "asdf://stsci.edu/datamodels/roman/tags/reference_files/ipc-1.0.0": "IpcRef",
+    "asdf://stsci.edu/datamodels/roman/tags/reference_files/linearity-1.0.0": "LinearityRef",
+    "asdf://stsci.edu/datamodels/roman/tags/reference_files/mask-1.0.0": "MaskRef",
+    "asdf://stsci.edu/datamodels/roman/tags/reference_files/pixelarea-1.0.0": "PixelareaRef",
+    "asdf://stsci.edu/datamodels/roman/tags/reference_files/readnoise-1.0.0": "ReadnoiseRef",
+    "asdf://stsci.edu/datamodels/roman/tags/reference_files/saturation-1.0.0": "SaturationRef",
+    "asdf://stsci.edu/datamodels/roman/tags/reference_files/superbias-1.0.0": "SuperbiasRef",
+    "asdf://stsci.edu/datamodels/roman/tags/reference_files/wfi_img_photom-1.0.0": "WfiImgPhotomRef",
+    "asdf://stsci.edu/datamodels/roman/tags/associations-1.0.0": "Associations",
+    "asdf://stsci.edu/datamodels/roman/tags/cal_logs-1.0.0": "CalLogs",
+    "asdf://stsci.edu/datamodels/roman/tags/ref_file-1.0.0": "RefFile",
+    "asdf://stsci.edu/datamodels/roman/tags/calibration_software_version-1.0.0": "CalibrationSoftwareVersion",
+    "asdf://stsci.edu/datamodels/roman/tags/filename-1.0.0": "Filename",
+    "asdf://stsci.edu/datamodels/roman/tags/file_date-1.0.0": "FileDate",
+    "asdf://stsci.edu/datamodels/roman/tags/model_type-1.0.0": "ModelType",
+    "asdf://stsci.edu/datamodels/roman/tags/origin-1.0.0": "Origin",
+    "asdf://stsci.edu/datamodels/roman/tags/prd_software_version-1.0.0": "PrdSoftwareVersion",
+    "asdf://stsci.edu/datamodels/roman/tags/sdf_software_version-1.0.0": "SdfSoftwareVersion",
+    "asdf://stsci.edu/datamodels/roman/tags/telescope-1.0.0": "Telescope",
+    "asdf://stsci.edu/datamodels/roman/tags/unit-1.0.0": "Unit",
+}
@@ -10,11 +10,10 @@ import copy
 import datetime
 import os
 import os.path
-import sys
 import warnings
+import weakref
 from collections import OrderedDict
 from collections.abc import Sequence
-from pathlib import PurePath
 
 import asdf
 import numpy as np
@@ -59,30 +58,154 @@ __all__ = [
 ]
 
 
+# The tag to schema mapping is static, so build it once rather than searching
+# the extension's tags each time a model's schema is requested.
+_TAG_URI_TO_SCHEMA_URI = {tag.tag_uri: tag.schema_uris[0] for tag in DATAMODEL_EXTENSIONS[0].tags}
+
+_IMMUTABLE_TYPES = frozenset([type(None), bool, int, float, complex, str, bytes])
+
+
+def _fast_deepcopy(obj, memo):
+    """
+    Deep copy a model tree, dispatching directly on the concrete types that
+    make up the tree rather than going through the generic `copy.deepcopy`
+    machinery. Anything else is handed off to `copy.deepcopy`.
+
+    Plain containers are not registered in ``memo``; only nodes and arrays are,
+    so that shared references to them are preserved in the copy.
+    """
+    cls = obj.__class__
+    if cls in _IMMUTABLE_TYPES:
+        return obj
+    if cls is dict:
+        return {key: _fast_deepcopy(val, memo) for key, val in obj.items()}
+    if cls is list:
+        return [_fast_deepcopy(val, memo) for val in obj]
+    if cls is tuple:
+        return tuple(_fast_deepcopy(val, memo) for val in obj)
+
+    obj_id = id(obj)
+    if obj_id in memo:
+        return memo[obj_id]
+
+    if isinstance(obj, np.ndarray) and not obj.dtype.hasobject:
+        # A straight copy of the buffer, keeping the array subclass (e.g.
+        # Quantity), rather than going through ndarray.__deepcopy__. Object
+        # arrays still need their elements deep copied so are not included.
+        result = obj.copy(order="K")
+    elif isinstance(obj, stnode.DNode):
+        result = obj._new_with_data(_fast_deepcopy(obj._data, memo))
+    elif isinstance(obj, stnode.LNode):
+        result = cls.__new__(cls)
+        result.__dict__.update(obj.__dict__)
+        result.data = _fast_deepcopy(obj.data, memo)
+        result._wrappers = {}
+    else:
+        return copy.deepcopy(obj, memo)
+
+    memo[obj_id] = result
+    return result
+
+
+def _forward_to_instance(name):
+    """
+    Create a property forwarding reads of attribute ``name`` to the model's node,
+    so that frequently used attributes do not have to fall through to
+    `DataModel.__getattr__`.
+    """
+
+    def fget(self):
+        return getattr(self._instance, name)
+
+    return property(fget, doc=f"The ``{name}`` attribute of the model's node.")
+
+
+# Kinds of tree nodes, keyed by their exact type, for walking a model's tree
+_MAPPING, _SEQUENCE, _LEAF = range(3)
+_NODE_KINDS = {}
+
+
+def _node_kind(cls):
+    """
+    Classify a type of tree node for the tree walk. The result is cached, so
+    that seeing a type again only costs a lookup on the exact type instead of
+    ``isinstance`` checks. Classes created later are classified when first seen.
+    """
+    if issubclass(cls, (stnode.DNode, dict)):
+        kind = _MAPPING
+    elif issubclass(cls, (stnode.LNode, list, tuple)):
+        kind = _SEQUENCE
+    else:
+        kind = _LEAF
+    _NODE_KINDS[cls] = kind
+    return kind
+
+
+def _datetime_to_str(val):
+    return val.isoformat()
+
+
+# Conversion applied to leaves of a flattened model, keyed by their exact type
+_LEAF_CONVERTERS = {}
+
+
+def _leaf_converter(cls):
+    """
+    Find the conversion for a type of leaf when flattening a model, `None`
+    meaning that it is left as is. As for `_node_kind` the result is cached
+    so that each leaf only costs a lookup on its exact type.
+    """
+    if issubclass(cls, datetime.datetime):
+        converter = _datetime_to_str
+    elif issubclass(cls, Time):
+        converter = str
+    else:
+        converter = None
+    _LEAF_CONVERTERS[cls] = converter
+    return converter
+
+
 class DataModel:
     """Base class for all top level datamodels"""
 
+    # __dict__ keeps arbitrary private attributes working on a plain DataModel,
+    # as they do on the subclasses, which do not declare slots.
+    __slots__ = ("_iscopy", "_shape", "_instance", "_asdf", "_files_to_close", "_schema_uri_cached", "__weakref__", "__dict__")
+
     crds_observatory = "roman"
 
+    # Node class wrapped by this model, set from model_registry
+    _NODE_CLS = None
+
+    # Name of the "primary" array, which controls the size of other arrays
+    # that are implicitly created.
+    _primary_array_name = "data"
+
+    # Writes are still routed to the node by __setattr__
+    meta = _forward_to_instance("meta")
+    data = _forward_to_instance("data")
+    dq = _forward_to_instance("dq")
+    err = _forward_to_instance("err")
+    coeffs = _forward_to_instance("coeffs")
+
     def __init__(self, init=None, **kwargs):
         self._iscopy = False
         self._shape = None
         self._instance = None
         self._asdf = None
+        self._schema_uri_cached = None
         if init is None:
-            asdffile = self.open_asdf(init=None, **kwargs)
-        elif isinstance(init, (str, bytes, PurePath)):
-            if isinstance(init, PurePath):
-                init = str(init)
-            if isinstance(init, bytes):
-                init = init.decode(sys.getfilesystemencoding())
-            asdffile = self.open_asdf(init, **kwargs)
+            # The AsdfFile is only created if it is needed, see _asdf_lazy
+            return
+        elif isinstance(init, (str, bytes, os.PathLike)):
+            asdffile = self.open_asdf(os.fsdecode(init), **kwargs)
+            self._close_on_collect(asdffile)
             if not self.check_type(asdffile):
                 raise ValueError(f"ASDF file is not of the type expected. Expected {self.__class__.__name__}")
             self._instance = asdffile.tree["roman"]
         elif isinstance(init, asdf.AsdfFile):
             asdffile = init
-            self._asdf = asdffile
+            self._close_on_collect(asdffile)
             self._instance = asdffile.tree["roman"]
         elif isinstance(init, stnode.TaggedObjectNode):
             self._instance = init
@@ -99,16 +222,35 @@ class DataModel:
         if "roman" not in asdffile_instance.tree:
             raise ValueError('ASDF file does not have expected "roman" attribute')
         topnode = asdffile_instance.tree["roman"]
-        if model_registry[topnode.__class__] != self.__class__:
-            return False
-        return True
+        if topnode.__class__ is self._NODE_CLS:
+            return True
+        # Models added to model_registry after import have no _NODE_CLS
+        return model_registry.get(topnode.__class__) is self.__class__
 
     @property
     def schema_uri(self):
-        # Determine the schema corresponding to this model's tag
-        schema_uri = next(t for t in DATAMODEL_EXTENSIONS[0].tags if t.tag_uri == self._instance._tag).schema_uri
+        # Determine the schema corresponding to this model's tag, the result
+        # is cached for as long as the model wraps the same node.
+        cached = self._schema_uri_cached
+        if cached is not None and cached[0] is self._instance:
+            return cached[1]
+
+        schema_uri = _TAG_URI_TO_SCHEMA_URI[self._instance._tag]
+        self._schema_uri_cached = (self._instance, schema_uri)
         return schema_uri
 
+    @property
+    def _asdf_lazy(self):
+        """
+        The model's AsdfFile, created on first use for models initialized
+        without one.
+        """
+        if self._asdf is None:
+            self._asdf = self.open_asdf()
+            if self._instance is not None:
+                self._asdf["roman"] = self._instance
+        return self._asdf
+
     def close(self):
         if not self._iscopy:
             if self._asdf is not None:
@@ -120,9 +262,15 @@ class DataModel:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
 
-    def __del__(self):
-        """Ensure closure of resources when deleted."""
-        self.close()
+    def _close_on_collect(self, asdffile):
+        """
+        Ensure closure of the file when the model is garbage collected.
+
+        This uses a finalizer rather than ``__del__``, which would make it
+        harder for the garbage collector to free models caught in reference
+        cycles. The finalizer does not hold a reference to the model.
+        """
+        weakref.finalize(self, asdffile.close)
 
     def copy(self, memo=None):
         result = self.__class__(init=None)
@@ -134,8 +282,13 @@ class DataModel:
     @staticmethod
     def clone(target, source, deepcopy=False, memo=None):
         if deepcopy:
-            instance = copy.deepcopy(source._instance, memo=memo)
-            target._asdf = source._asdf.copy()
+            instance = _fast_deepcopy(source._instance, {} if memo is None else memo)
+            if source._asdf is not None:
+                # Wrap the copied node in a new AsdfFile instead of copying the
+                # source's, which would deep copy its tree a second time.
+                # Setting the node as an item skips re-validating the tree.
+                target._asdf = asdf.AsdfFile(uri=source._asdf.uri, extensions=source._asdf.extensions)
+                target._asdf["roman"] = instance
             target._instance = instance
             target._iscopy = True
         else:
@@ -145,32 +298,30 @@ class DataModel:
 
         target._files_to_close = []
         target._shape = source._shape
-        target._ctx = target
 
     def save(self, path, dir_path=None, *args, **kwargs):
         if callable(path):
-            path_head, path_tail = os.path.split(path(self.meta.filename))
-        else:
-            path_head, path_tail = os.path.split(path)
+            path = path(self.meta.filename)
+        path_head, path_tail = os.path.split(os.fsdecode(path))
         base, ext = os.path.splitext(path_tail)
-        if isinstance(ext, bytes):
-            ext = ext.decode(sys.getfilesystemencoding())
 
         if dir_path:
             path_head = dir_path
         output_path = os.path.join(path_head, path_tail)
 
         # TODO: Support gzip-compressed fits
-        if ext == ".asdf":
+        if ext.lower() == ".asdf":
             self.to_asdf(output_path, *args, **kwargs)
         else:
             raise ValueError(f"unknown filetype {ext}")
 
         return output_path
 
-    def open_asdf(self, init=None, **kwargs):
+    def open_asdf(self, init=None, memmap=True, **kwargs):
         if isinstance(init, str):
-            asdffile = asdf.open(init)
+            # Memory mapping avoids reading the array blocks into memory,
+            # but the arrays can then only be modified in an "rw" file.
+            asdffile = asdf.open(init, copy_arrays=not memmap)
         else:
             asdffile = asdf.AsdfFile(init)
         return asdffile
@@ -178,22 +329,29 @@ class DataModel:
     def to_asdf(self, init, *args, **kwargs):
         # self.on_save(init)
 
-        asdffile = self.open_asdf(**kwargs)
-        asdffile.tree = {"roman": self._instance}
+        # Write a new AsdfFile rather than the model's own, which write_to
+        # would modify (it sets the uri and rewrites the asdf_library entry).
+        # The node is set as an item rather than by assigning the tree, which
+        # would validate the tree even though write_to validates it again
+        # while serializing it.
+        asdffile = self.open_asdf()
+        asdffile["roman"] = self._instance
+
+        # Drop the read options that may be passed along with the write ones
+        kwargs.pop("memmap", None)
+        kwargs.pop("copy_arrays", None)
         asdffile.write_to(init, *args, **kwargs)
 
     def get_primary_array_name(self):
         """
         Returns the name "primary" array for this model, which
         controls the size of other arrays that are implicitly created.
-        This is intended to be overridden in the subclasses if the
-        primary array's name is not "data".
+        Subclasses whose primary array's name is not "data" should
+        override the ``_primary_array_name`` class attribute.
         """
-        if hasattr(self, "data"):
-            primary_array_name = "data"
-        else:
-            primary_array_name = ""
-        return primary_array_name
+        if hasattr(self._instance, self._primary_array_name):
+            return self._primary_array_name
+        return ""
 
     @property
     def override_handle(self):
@@ -206,28 +364,35 @@ class DataModel:
     @property
     def shape(self):
         if self._shape is None:
-            primary_array_name = self.get_primary_array_name()
-            if primary_array_name and hasattr(self, primary_array_name):
-                primary_array = getattr(self, primary_array_name)
+            primary_array = getattr(self._instance, self._primary_array_name, None)
+            if primary_array is not None:
                 self._shape = primary_array.shape
         return self._shape
 
     def __setattr__(self, attr, value):
-        if attr.startswith("_"):
-            self.__dict__[attr] = value
+        # attr[:1] rather than attr[0], which raises IndexError for ""
+        if attr[:1] == "_":
+            object.__setattr__(self, attr, value)
         else:
             setattr(self._instance, attr, value)
 
     def __getattr__(self, attr):
-        return getattr(self._instance, attr)
+        # Fail fast on the special method lookups made by copy, pickle, etc.
+        if attr[:2] == "__":
+            raise AttributeError(attr)
+        return getattr(object.__getattribute__(self, "_instance"), attr)
 
     def __setitem__(self, key, value):
         if key.startswith("_"):
             raise ValueError("May not specify attributes/keys that start with _")
-        if hasattr(self._instance, key):
-            setattr(self._instance, key, value)
+        # Check the node's data directly, only then falling back to its class
+        # for properties, rather than going through the node's __getattr__
+        instance = self._instance
+        data = instance._data
+        if key in data or hasattr(instance.__class__, key):
+            setattr(instance, key, value)
         else:
-            self._instance._data[key] = value
+            data[key] = value
 
     def to_flat_dict(self, include_arrays=True):
         """
@@ -243,17 +408,47 @@ class DataModel:
         directly used
         """
 
-        def convert_val(val):
-            if isinstance(val, datetime.datetime):
-                return val.isoformat()
-            elif isinstance(val, Time):
-                return str(val)
-            return val
+        return {key: val for key, val in self._walk_leaves(include_arrays=include_arrays)}
 
-        if include_arrays:
-            return {"roman." + key: convert_val(val) for (key, val) in self.items()}
-        else:
-            return {"roman." + key: convert_val(val) for (key, val) in self.items() if not isinstance(val, np.ndarray)}
+    def _walk_leaves(self, include_arrays=True, scalar_only=False):
+        """
+        Iterate over the ``("roman." + key, value)`` pairs of the model leaves,
+        filtering and converting them in a single pass over the tree.
+
+        Parameters
+        ----------
+        include_arrays : bool
+            If `False`, array leaves are skipped.
+        scalar_only : bool
+            If `True`, only leaves whose (converted) value is a basic scalar
+            type are emitted.
+        """
+        # Bind the names used for every leaf locally
+        is_instance = isinstance
+        ndarray = np.ndarray
+        converters = _LEAF_CONVERTERS
+        scalar_types = (str, int, float, complex, bool)
+
+        for key, val in self.items():
+            if scalar_only:
+                # arrays are never scalars, so reject them without converting
+                if val.__class__ is ndarray:
+                    continue
+            elif not include_arrays and is_instance(val, ndarray):
+                continue
+
+            cls = val.__class__
+            try:
+                converter = converters[cls]
+            except KeyError:
+                converter = _leaf_converter(cls)
+            if converter is not None:
+                val = converter(val)
+
+            if scalar_only and not is_instance(val, scalar_types):
+                continue
+
+            yield "roman." + key, val
 
     def items(self):
         """
@@ -269,17 +464,45 @@ class DataModel:
         schemas directly.
         """
 
-        def recurse(tree, path=[]):
-            if isinstance(tree, (stnode.DNode, dict)):
-                for key, val in tree.items():
-                    yield from recurse(val, path + [key])
-            elif isinstance(tree, (stnode.LNode, list, tuple)):
-                for i, val in enumerate(tree):
-                    yield from recurse(val, path + [i])
-            elif tree is not None:
-                yield (".".join(str(x) for x in path), tree)
-
-        yield from recurse(self._instance)
+        # Walk the tree with an explicit stack rather than nested generators,
+        # children are pushed in reverse so that items are emitted in order.
+        # A single path list is shared by the whole walk: each stack entry
+        # records the length of its parent's path, which the path is trimmed
+        # back to before the entry's key is appended.
+        # Everything used inside the loop is bound to a local name first, as
+        # the loop runs once for every node of the tree.
+        get_kind = _NODE_KINDS.get
+        sep_join = ".".join
+        to_str = str
+
+        path = []
+        path_append = path.append
+        stack = [(-1, None, self._instance)]
+        stack_pop = stack.pop
+        stack_extend = stack.extend
+        while stack:
+            depth, key, tree = stack_pop()
+            if depth >= 0:
+                del path[depth:]
+                path_append(key)
+
+            cls = tree.__class__
+            kind = get_kind(cls)
+            if kind is None:
+                kind = _node_kind(cls)
+
+            if kind == _MAPPING:
+                depth = len(path)
+                children = [(depth, key, val) for key, val in tree.items()]
+            elif kind == _SEQUENCE:
+                depth = len(path)
+                children = [(depth, i, val) for i, val in enumerate(tree)]
+            else:
+                if tree is not None:
+                    yield (sep_join(map(to_str, path)), tree)
+                continue
+            children.reverse()
+            stack_extend(children)
 
     def get_crds_parameters(self):
         """
@@ -289,12 +512,7 @@ class DataModel:
         -------
         dict
         """
-        crds_header = {
-            key: val
-            for key, val in self.to_flat_dict(include_arrays=False).items()
-            if isinstance(val, (str, int, float, complex, bool))
-        }
-        return crds_header
+        return {key: val for key, val in self._walk_leaves(include_arrays=False, scalar_only=True)}
 
     def validate(self):
         """
@@ -303,13 +521,13 @@ class DataModel:
         validate.value_change(self._instance, pass_invalid_values=False, strict_validation=True)
 
     def info(self, *args, **kwargs):
-        return self._asdf.info(*args, **kwargs)
+        return self._asdf_lazy.info(*args, **kwargs)
 
     def search(self, *args, **kwargs):
-        return self._asdf.search(*args, **kwargs)
+        return self._asdf_lazy.search(*args, **kwargs)
 
     def schema_info(self, *args, **kwargs):
-        return self._asdf.schema_info(*args, **kwargs)
+        return self._asdf_lazy.schema_info(*args, **kwargs)
 
 
 class ImageModel(DataModel):
@@ -536,36 +754,15 @@ class IpcRefModel(DataModel):
 
 
 class LinearityRefModel(DataModel):
-    def get_primary_array_name(self):
-        """
-        Returns the name "primary" array for this model, which
-        controls the size of other arrays that are implicitly created.
-        This is intended to be overridden in the subclasses if the
-        primary array's name is not "data".
-        """
-        return "coeffs"
+    _primary_array_name = "coeffs"
 
 
 class InverseLinearityRefModel(DataModel):
-    def get_primary_array_name(self):
-        """
-        Returns the name "primary" array for this model, which
-        controls the size of other arrays that are implicitly created.
-        This is intended to be overridden in the subclasses if the
-        primary array's name is not "data".
-        """
-        return "coeffs"
+    _primary_array_name = "coeffs"
 
 
 class MaskRefModel(DataModel):
-    def get_primary_array_name(self):
-        """
-        Returns the name "primary" array for this model, which
-        controls the size of other arrays that are implicitly created.
-        This is intended to be overridden in the subclasses if the
-        primary array's name is not "data".
-        """
-        return "dq"
+    _primary_array_name = "dq"
 
 
 class PixelareaRefModel(DataModel):
@@ -600,7 +797,10 @@ def open(init, memmap=False, target=None, **kwargs):
             - string indicating the path to an ASDF file
             - `DataModel` Roman data model instance
     memmap : bool
-        Open ASDF file binary data using memmap (default: False)
+        Open ASDF file binary data using memmap (default: False).
+        Memory mapped arrays are not read into memory until used, but
+        cannot be modified unless the file is opened with ``mode="rw"``,
+        in which case changes are written back to the file.
     target : `DataModel`
         If not None value, the `DataModel` implied by the init argument
         must be an instance of the target class. If the init value
@@ -637,9 +837,9 @@ def open(init, memmap=False, target=None, **kwargs):
             raise TypeError("Open requires a filepath, file-like object, or Roman datamodel")
         if AsdfInFits is not None and isinstance(asdffile, AsdfInFits):
             raise TypeError("Roman datamodels does not accept FITS files or objects")
-    modeltype = type(asdffile.tree["roman"])
-    if modeltype in model_registry:
-        rmodel = model_registry[modeltype](asdffile, **kwargs)
+    model_type = model_registry.get(type(asdffile.tree["roman"]))
+    if model_type is not None:
+        rmodel = model_type(asdffile, **kwargs)
         if target is not None:
             if not issubclass(rmodel.__class__, target):
                 raise ValueError("Referenced ASDF file model type is not subclass of target")
@@ -670,3 +870,9 @@ model_registry = {
     stnode.SuperbiasRef: SuperbiasRefModel,
     stnode.WfiImgPhotomRef: WfiImgPhotomRefModel,
 }
+
+# Record the node class on each registered model, so check_type only needs a
+# registry lookup for models registered later
+for _node_cls, _model_cls in model_registry.items():
+    _model_cls._NODE_CLS = _node_cls
+del _node_cls, _model_cls
@@ -3,8 +3,10 @@ Proof of concept of using tags with the data model framework
 """
 
 import datetime
+import functools
 import sys
 import warnings
+import weakref
 from abc import ABCMeta
 from collections import UserList
 
@@ -21,14 +23,27 @@ from asdf.util import HashableDict
 from astropy.time import Time
 from astropy.units import Unit  # noqa: F401
 
+from ._stnode_tables import _TAG_TO_CLASS_NAME
 from .stuserdict import STUserDict as UserDict
-from .validate import ValidationWarning, _check_type, _error_message
+from .validate import ValidationWarning, _check_type, _error_message, _get_validator_context, _IdentityCache, _release_blocks
 
 if sys.version_info < (3, 9):
     import importlib_resources
 else:
     import importlib.resources as importlib_resources
 
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+# Parse the manifest with libyaml when PyYAML was built with it; the
+# pure-Python loader takes about ten times as long on every import.
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 __all__ = [
     "set_validate",
@@ -81,88 +96,258 @@ def _value_change(path, value, schema, pass_invalid_values, strict_validation, c
     return update
 
 
+_ASDF_METASCHEMA_URI = "http://stsci.edu/schemas/asdf-schema/0.1.0/asdf-schema"
+
+# Keywords fastjsonschema checks exactly as the asdf validators do for plain
+# (non-None) scalars, and keywords that do not constrain the value at all.
+# A schema using anything else (tag, datatype, combiners, ...) is always
+# checked by the asdf validators.
+_COMPILED_KEYWORDS = frozenset(
+    (
+        "type",
+        "enum",
+        "pattern",
+        "minLength",
+        "maxLength",
+        "minimum",
+        "maximum",
+        "exclusiveMinimum",
+        "exclusiveMaximum",
+    )
+)
+_ANNOTATION_KEYWORDS = frozenset(("$schema", "id", "title", "description", "default", "archive_catalog", "sdf"))
+_COMPILED_VALUE_TYPES = frozenset((str, int, float, bool))
+# fastjsonschema treats bools as numbers, so without a type keyword it
+# applies minimum and maximum to them where jsonschema does not.
+_UNTYPED_COMPILED_VALUE_TYPES = _COMPILED_VALUE_TYPES - {bool}
+
+# Validators keyed by the property schema and context they check with (see
+# `_PropertyValidator`)
+_VALIDATOR_CACHE = _IdentityCache()
+
+
+def _compile_validator(schema):
+    """
+    Compile ``schema`` with fastjsonschema, or return `None` if it is not
+    available or the schema uses keywords it would not check the same way.
+    """
+    if fastjsonschema is None or not schema.keys() <= _COMPILED_KEYWORDS | _ANNOTATION_KEYWORDS:
+        return None
+    # fastjsonschema compares enum members with ==, which does not tell
+    # True from 1 the way jsonschema does.
+    if not all(isinstance(member, str) for member in schema.get("enum", ())):
+        return None
+
+    compiled_schema = {key: value for key, value in schema.items() if key in _COMPILED_KEYWORDS}
+    compiled_schema["$schema"] = "http://json-schema.org/draft-04/schema#"
+    return fastjsonschema.compile(compiled_schema)
+
+
+class _PropertyValidator:
+    """
+    Checks values against a property schema: plain scalars with the
+    fastjsonschema function compiled from it, when there is one, and
+    anything else with the asdf validator, built only once a value needs it.
+    Values the compiled function rejects are checked again by the asdf
+    validator, so that errors carry the same details either way.
+    """
+
+    __slots__ = ("schema", "ctx", "compiled", "compiled_types", "_validator")
+
+    def __init__(self, schema, ctx):
+        self.schema = schema
+        self.ctx = ctx
+        self.compiled = _compile_validator(schema)
+        self.compiled_types = _COMPILED_VALUE_TYPES if "type" in schema else _UNTYPED_COMPILED_VALUE_TYPES
+        self._validator = None
+
+    @property
+    def validator(self):
+        """
+        The asdf validator for the schema.
+        """
+        if self._validator is None:
+            temp_schema = {"$schema": _ASDF_METASCHEMA_URI}
+            temp_schema.update(self.schema)
+            self._validator = asdfschema.get_validator(temp_schema, self.ctx, validator_callbacks)
+        return self._validator
+
+    def validate(self, value):
+        compiled = self.compiled
+        if compiled is not None and value.__class__ in self.compiled_types:
+            try:
+                compiled(value)
+                return
+            except fastjsonschema.JsonSchemaValueException:
+                pass
+
+        self.validator.validate(value)
+
+
+def _get_property_validator(schema, validator_context):
+    """
+    Return the `_PropertyValidator` for ``schema``, creating it on the first
+    request.
+    """
+    validator = _VALIDATOR_CACHE.get(schema, validator_context)
+    if validator is None:
+        validator = _VALIDATOR_CACHE.set(schema, validator_context, _PropertyValidator(schema, validator_context))
+    return validator
+
+
 def _check_value(value, schema, validator_context):
     """
     Perform the actual validation.
     """
+    _get_property_validator(schema, validator_context).validate(value)
 
-    temp_schema = {"$schema": "http://stsci.edu/schemas/asdf-schema/0.1.0/asdf-schema"}
-    temp_schema.update(schema)
-    validator = asdfschema.get_validator(temp_schema, validator_context, validator_callbacks)
 
-    validator.validate(value, _schema=temp_schema)
-    validator_context.close()
+# Values of these exact types are already in their tagged form
+_PLAIN_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
 
 
 def _validate(attr, instance, schema, ctx):
-    tagged_tree = yamlutil.custom_tree_to_tagged_tree(instance, ctx)
-    return _value_change(attr, tagged_tree, schema, False, strict_validation, ctx)
+    if instance.__class__ in _PLAIN_SCALAR_TYPES:
+        return _value_change(attr, instance, schema, False, strict_validation, ctx)
+    try:
+        tagged_tree = yamlutil.custom_tree_to_tagged_tree(instance, ctx)
+        return _value_change(attr, tagged_tree, schema, False, strict_validation, ctx)
+    finally:
+        _release_blocks(ctx)
+
+
+# Marks a key missing from a node or cache, where None is a valid value
+_MISSING = object()
+
+
+# Property subschemas keyed by the parent schema and the property name.
+# Parent schemas are shared by every node of a class (see
+# `TaggedObjectNode.get_schema`), so entries stay valid for the life of the
+# process.
+_PROPERTY_SCHEMA_CACHE = _IdentityCache()
 
 
 def _get_schema_for_property(schema, attr):
+    subschema = _PROPERTY_SCHEMA_CACHE.get(schema, attr, _MISSING)
+    if subschema is _MISSING:
+        subschema = _PROPERTY_SCHEMA_CACHE.set(schema, attr, _find_schema_for_property(schema, attr))
+    return subschema
+
+
+# Schemas used to validate attribute assignments, keyed like
+# _PROPERTY_SCHEMA_CACHE.
+_ATTRIBUTE_SCHEMA_CACHE = _IdentityCache()
+
+
+def _get_schema_for_attribute(schema, attr):
+    """
+    Return the schema used to validate an assignment to attribute ``attr`` of
+    a node with ``schema``, or `None` if the assignment is not validated.
+    """
+    subschema = _ATTRIBUTE_SCHEMA_CACHE.get(schema, attr, _MISSING)
+    if subschema is not _MISSING:
+        return subschema
+
+    subschema = schema.get("properties")
+    if subschema is None:
+        # See if the key is in one of the combiners.
+        # This implementation is not completely general
+        # A more robust one would potentially handle nested
+        # references, though that is probably unlikely
+        # in practical cases.
+        for combiner in ["allOf", "anyOf"]:
+            for combined in schema.get(combiner, []):
+                subsubschema = _find_schema_for_property(combined, attr)
+                if subsubschema != {}:
+                    subschema = subsubschema
+                    break
+    else:
+        subschema = subschema.get(attr, None)
+
+    return _ATTRIBUTE_SCHEMA_CACHE.set(schema, attr, subschema)
+
+
+def _find_schema_for_property(schema, attr):
     subschema = schema.get("properties", {}).get(attr, None)
     if subschema is not None:
         return subschema
     for combiner in ["allOf", "anyOf"]:
         for subschema in schema.get(combiner, []):
-            subsubschema = _get_schema_for_property(subschema, attr)
+            subsubschema = _find_schema_for_property(subschema, attr)
             if subsubschema != {}:
                 return subsubschema
     return {}
 
 
+class _SharedContext:
+    """
+    Class attribute holding the `asdf.AsdfFile` shared by all nodes.
+
+    The file cannot be created when this module is imported, since that
+    would re-enter the loading of this package's asdf extensions. Instead
+    it is created on first access, and the descriptor replaces itself with
+    the file so later reads are plain class attribute lookups.
+    """
+
+    def __get__(self, instance, owner):
+        ctx = _get_validator_context()
+        DNode.ctx = ctx
+        TaggedScalarNode.ctx = ctx
+        return ctx
+
+
 class DNode(UserDict):
+    # The node's own state lives in slots.  STUserDict does not declare any,
+    # so instances still have a (normally empty) __dict__.
+    __slots__ = ("_data", "_x_schema", "_schema_uri", "_parent", "_name")
+
     _tag = None
-    _ctx = None
+    ctx = _SharedContext()
 
     def __init__(self, node=None, parent=None, name=None):
         if node is None:
-            self.__dict__["_data"] = {}
-        elif isinstance(node, dict):
-            self.__dict__["_data"] = node
-        else:
+            node = {}
+        elif not isinstance(node, dict):
             raise ValueError("Initializer only accepts dicts")
-        self._x_schema = None
-        self._schema_uri = None
-        self._parent = parent
-        self._name = name
+        # Fill the slots through their descriptors rather than __setattr__
+        _set_data(self, node)
+        _set_x_schema(self, None)
+        _set_schema_uri(self, None)
+        _set_parent(self, parent)
+        _set_name(self, name)
         # else:
         #     self.data = node.data
 
     # def __iter__(self):
     #     return NodeIterator(self)
 
-    @property
-    def ctx(self):
-        if self._ctx is None:
-            DNode._ctx = asdf.AsdfFile()
-        return self._ctx
-
     @staticmethod
     def _convert_to_scalar(key, value):
-        if key in _SCALAR_NODE_CLASSES_BY_KEY:
-            value = _SCALAR_NODE_CLASSES_BY_KEY[key](value)
+        scalar_class = _get_scalar_node_class(key)
+        if scalar_class is None:
+            return value
 
-        return value
+        return scalar_class(value)
 
     def __getattr__(self, key):
         """
         Permit accessing dict keys as attributes, assuming they are legal Python
         variable names.
         """
-        if key.startswith("_"):
+        if key[:1] == "_":
             raise AttributeError(f"No attribute {key}")
-        if key in self._data:
-            value = self._convert_to_scalar(key, self._data[key])
-            if isinstance(value, dict):
-                return DNode(value, parent=self, name=key)
-            elif isinstance(value, list):
-                return LNode(value)
-            else:
-                return value
-        else:
+        value = self._data.get(key, _MISSING)
+        if value is _MISSING:
             raise AttributeError(f"No such attribute ({key}) found in node")
 
+        value = self._convert_to_scalar(key, value)
+        if isinstance(value, dict):
+            return DNode(value, parent=self, name=key)
+        elif isinstance(value, list):
+            return LNode(value)
+        else:
+            return value
+
     def __setattr__(self, key, value):
         """
         Permit assigning dict keys as attributes.
@@ -171,29 +356,14 @@ class DNode(UserDict):
             value = self._convert_to_scalar(key, value)
             if key in self._data:
                 if validate:
-                    self._schema()
-                    schema = self._x_schema.get("properties")
-                    if schema is None:
-                        # See if the key is in one of the combiners.
-                        # This implementation is not completely general
-                        # A more robust one would potentially handle nested
-                        # references, though that is probably unlikely
-                        # in practical cases.
-                        for combiner in ["allOf", "anyOf"]:
-                            for subschema in self._x_schema.get(combiner, []):
-                                subsubschema = _get_schema_for_property(subschema, key)
-                                if subsubschema != {}:
-                                    schema = subsubschema
-                                    break
-                    else:
-                        schema = schema.get(key, None)
-                    if schema is None or _validate(key, value, schema, self.ctx):
-                        self._data[key] = value
-                self.__dict__["_data"][key] = value
+                    schema = _get_schema_for_attribute(self._schema(), key)
+                    if schema is not None:
+                        _validate(key, value, schema, self.ctx)
+                self._data[key] = value
             else:
                 raise AttributeError(f"No such attribute ({key}) found in node")
         else:
-            self.__dict__[key] = value
+            object.__setattr__(self, key, value)
 
     def to_flat_dict(self, include_arrays=True):
         """
@@ -231,19 +401,76 @@ class DNode(UserDict):
             # Extract the subschema corresponding to this node.
             subschema = _get_schema_for_property(parent_schema, self._name)
             self._x_schema = subschema
+        return self._x_schema
 
     def __asdf_traverse__(self):
         return dict(self)
 
+    # The mapping protocol is delegated straight to the underlying dict so
+    # that lookups and iteration run at dict speed instead of going through
+    # the generic MutableMapping mixin methods.
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        return self._data.get(key, default)
+
+    def keys(self):
+        return self._data.keys()
+
+    def values(self):
+        return self._data.values()
+
+    def items(self):
+        return self._data.items()
+
     def __setitem__(self, key, value):
         value = self._convert_to_scalar(key, value)
-        if isinstance(value, dict):
-            for sub_key, sub_value in value.items():
-                value[sub_key] = self._convert_to_scalar(sub_key, sub_value)
-        super().__setitem__(key, value)
+        # Only the keys registered for scalar nodes need converting, and
+        # usually there are none, which isdisjoint finds without allocating.
+        if isinstance(value, dict) and not _SCALAR_KEYS.isdisjoint(value):
+            for sub_key in _SCALAR_KEYS.intersection(value):
+                value[sub_key] = _SCALAR_NODE_CLASSES_BY_KEY[sub_key](value[sub_key])
+        self._data[key] = value
+
+    def __delitem__(self, key):
+        del self._data[key]
+
+    def _new_with_data(self, data):
+        """
+        Return a node of the same class and with the same state as this one,
+        but wrapping ``data``.
+        """
+        inst = self.__class__.__new__(self.__class__)
+        for name in DNode.__slots__:
+            object.__setattr__(inst, name, getattr(self, name))
+        object.__setattr__(inst, "_data", data)
+        inst.__dict__.update(self.__dict__)
+        return inst
+
+    def __copy__(self):
+        return self._new_with_data(self._data.copy())
+
+
+_set_data = DNode._data.__set__
+_set_x_schema = DNode._x_schema.__set__
+_set_schema_uri = DNode._schema_uri.__set__
+_set_parent = DNode._parent.__set__
+_set_name = DNode._name.__set__
 
 
 class LNode(UserList):
+    __slots__ = ()
+
     _tag = None
 
     def __init__(self, node=None):
@@ -253,18 +480,38 @@ class LNode(UserList):
             self.data = node
         else:
             raise ValueError("Initializer only accepts lists")
+        # Wrappers built for container elements, keyed by index.  Each entry
+        # also holds the element it wraps, so an entry only counts once the
+        # element at that index is checked to still be the same object; this
+        # keeps the cache correct across any mutation of the list.
+        self._wrappers = {}
         # else:
         #     self.data = node.data
 
     def __getitem__(self, index):
         value = self.data[index]
         if isinstance(value, dict):
-            return DNode(value)
+            wrapper_class = DNode
         elif isinstance(value, list):
-            return LNode(value)
+            wrapper_class = LNode
         else:
             return value
 
+        # A slice is a new list every time, so there is nothing to reuse
+        if isinstance(index, slice):
+            return wrapper_class(value)
+
+        entry = self._wrappers.get(index)
+        if entry is None or entry[0] is not value:
+            entry = self._wrappers[index] = (value, wrapper_class(value))
+        return entry[1]
+
+    def __copy__(self):
+        # The copy builds its own wrappers rather than sharing this node's
+        inst = super().__copy__()
+        inst._wrappers = {}
+        return inst
+
     def __asdf_traverse__(self):
         return list(self)
 
@@ -291,6 +538,8 @@ class TaggedObjectNode(DNode, metaclass=TaggedObjectNodeMeta):
     Expects subclass to define a class instance of _tag
     """
 
+    __slots__ = ()
+
     @property
     def tag(self):
         return self._tag
@@ -301,9 +550,19 @@ class TaggedObjectNode(DNode, metaclass=TaggedObjectNodeMeta):
         return self._x_schema
 
     def get_schema(self):
-        """Retrieve the schema associated with this tag"""
-        extension_manager = self.ctx.extension_manager
-        tag_def = extension_manager.get_tag_definition(self.tag)
+        """
+        Retrieve the schema associated with this tag
+
+        The schema is loaded once per class and shared by all of its
+        instances, so it must not be modified.
+        """
+        return self._load_schema(self.ctx)
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _load_schema(cls, ctx):
+        extension_manager = ctx.extension_manager
+        tag_def = extension_manager.get_tag_definition(cls._tag)
         schema_uri = tag_def.schema_uris[0]
         schema = asdfschema.load_schema(schema_uri, resolve_references=True)
         return schema
@@ -327,6 +586,8 @@ class TaggedListNodeMeta(ABCMeta):
 
 
 class TaggedListNode(LNode, metaclass=TaggedListNodeMeta):
+    __slots__ = ()
+
     @property
     def tag(self):
         return self._tag
@@ -334,6 +595,9 @@ class TaggedListNode(LNode, metaclass=TaggedListNodeMeta):
 
 _SCALAR_NODE_CLASSES_BY_TAG = {}
 _SCALAR_NODE_CLASSES_BY_KEY = {}
+_get_scalar_node_class = _SCALAR_NODE_CLASSES_BY_KEY.get
+# The keys of _SCALAR_NODE_CLASSES_BY_KEY, rebuilt as each class registers
+_SCALAR_KEYS = frozenset()
 
 
 def _scalar_tag_to_key(tag):
@@ -347,23 +611,24 @@ class TaggedScalarNodeMeta(ABCMeta):
     """
 
     def __init__(self, *args, **kwargs):
+        global _SCALAR_KEYS
+
         super().__init__(*args, **kwargs)
         if self.__name__ != "TaggedScalarNode":
             if self._tag in _SCALAR_NODE_CLASSES_BY_TAG:
                 raise RuntimeError(f"TaggedScalarNode class for tag '{self._tag}' has been defined twice")
             _SCALAR_NODE_CLASSES_BY_TAG[self._tag] = self
-            _SCALAR_NODE_CLASSES_BY_KEY[_scalar_tag_to_key(self._tag)] = self
+            _SCALAR_NODE_CLASSES_BY_KEY[sys.intern(_scalar_tag_to_key(self._tag))] = self
+            _SCALAR_KEYS = frozenset(_SCALAR_NODE_CLASSES_BY_KEY)
+            # The plain type holding the scalar's value (str, Time, ...)
+            self._scalar_base = self.__bases__[0]
 
 
 class TaggedScalarNode(metaclass=TaggedScalarNodeMeta):
-    _tag = None
-    _ctx = None
+    __slots__ = ()
 
-    @property
-    def ctx(self):
-        if self._ctx is None:
-            TaggedScalarNode._ctx = asdf.AsdfFile()
-        return self._ctx
+    _tag = None
+    ctx = _SharedContext()
 
     def __asdf_traverse__(self):
         return self
@@ -377,8 +642,13 @@ class TaggedScalarNode(metaclass=TaggedScalarNodeMeta):
         return _scalar_tag_to_key(self._tag)
 
     def get_schema(self):
-        extension_manager = self.ctx.extension_manager
-        tag_def = extension_manager.get_tag_definition(self.tag)
+        return self._load_schema(self.ctx)
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _load_schema(cls, ctx):
+        extension_manager = ctx.extension_manager
+        tag_def = extension_manager.get_tag_definition(cls._tag)
         schema_uri = tag_def.schema_uris[0]
         schema = asdf.schema.load_schema(schema_uri, resolve_references=True)
         return schema
@@ -417,13 +687,15 @@ class TaggedObjectNodeConverter(Converter):
     Converter for all subclasses of TaggedObjectNode.
     """
 
+    _class_for_tag = _OBJECT_NODE_CLASSES_BY_TAG.__getitem__
+
     @property
     def tags(self):
-        return list(_OBJECT_NODE_CLASSES_BY_TAG.keys())
+        return _OBJECT_NODE_TAGS
 
     @property
     def types(self):
-        return list(_OBJECT_NODE_CLASSES_BY_TAG.values())
+        return _OBJECT_NODE_TYPES
 
     def select_tag(self, obj, tags, ctx):
         return obj.tag
@@ -432,7 +704,7 @@ class TaggedObjectNodeConverter(Converter):
         return obj._data
 
     def from_yaml_tree(self, node, tag, ctx):
-        return _OBJECT_NODE_CLASSES_BY_TAG[tag](node)
+        return self._class_for_tag(tag)(node)
 
 
 class TaggedListNodeConverter(Converter):
@@ -440,13 +712,15 @@ class TaggedListNodeConverter(Converter):
     Converter for all subclasses of TaggedListNode.
     """
 
+    _class_for_tag = _LIST_NODE_CLASSES_BY_TAG.__getitem__
+
     @property
     def tags(self):
-        return list(_LIST_NODE_CLASSES_BY_TAG.keys())
+        return _LIST_NODE_TAGS
 
     @property
     def types(self):
-        return list(_LIST_NODE_CLASSES_BY_TAG.values())
+        return _LIST_NODE_TYPES
 
     def select_tag(self, obj, tags, ctx):
         return obj.tag
@@ -455,7 +729,7 @@ class TaggedListNodeConverter(Converter):
         return list(obj)
 
     def from_yaml_tree(self, node, tag, ctx):
-        return _LIST_NODE_CLASSES_BY_TAG[tag](node)
+        return self._class_for_tag(tag)(node)
 
 
 class TaggedScalarNodeConverter(Converter):
@@ -463,32 +737,56 @@ class TaggedScalarNodeConverter(Converter):
     Converter for all subclasses of TaggedScalarNode.
     """
 
+    _class_for_tag = _SCALAR_NODE_CLASSES_BY_TAG.__getitem__
+
+    # Tags whose scalar value is itself serialized by the converter for
+    # another type (the scalar's base class)
+    _delegate_type_for_tag = {FileDate._tag: Time}.get
+
+    def __init__(self):
+        # Converters for the delegate types, per extension manager
+        self._delegate_converters = weakref.WeakKeyDictionary()
+
+    def _get_delegate_converter(self, delegate_type, ctx):
+        extension_manager = ctx.extension_manager
+        try:
+            converters = self._delegate_converters[extension_manager]
+        except KeyError:
+            converters = self._delegate_converters[extension_manager] = {}
+
+        converter = converters.get(delegate_type)
+        if converter is None:
+            converter = converters[delegate_type] = extension_manager.get_converter_for_type(delegate_type)
+        return converter
+
     @property
     def tags(self):
-        return list(_SCALAR_NODE_CLASSES_BY_TAG.keys())
+        return _SCALAR_NODE_TAGS
 
     @property
     def types(self):
-        return list(_SCALAR_NODE_CLASSES_BY_TAG.values())
+        return _SCALAR_NODE_TYPES
 
     def select_tag(self, obj, tags, ctx):
         return obj.tag
 
     def to_yaml_tree(self, obj, tag, ctx):
-        node = obj.__class__.__bases__[0](obj)
+        node = obj._scalar_base(obj)
 
-        if tag == FileDate._tag:
-            converter = ctx.extension_manager.get_converter_for_type(type(node))
+        delegate_type = self._delegate_type_for_tag(tag)
+        if delegate_type is not None:
+            converter = self._get_delegate_converter(delegate_type, ctx)
             node = converter.to_yaml_tree(node, tag, ctx)
 
         return node
 
     def from_yaml_tree(self, node, tag, ctx):
-        if tag == FileDate._tag:
-            converter = ctx.extension_manager.get_converter_for_type(Time)
+        delegate_type = self._delegate_type_for_tag(tag)
+        if delegate_type is not None:
+            converter = self._get_delegate_converter(delegate_type, ctx)
             node = converter.from_yaml_tree(node, tag, ctx)
 
-        return _SCALAR_NODE_CLASSES_BY_TAG[tag](node)
+        return self._class_for_tag(tag)(node)
 
 
 class UnitConverter(Converter):
@@ -507,7 +805,7 @@ class UnitConverter(Converter):
 
 
 _DATAMODELS_MANIFEST_PATH = importlib_resources.files(rad.resources) / "manifests" / "datamodels-1.0.yaml"
-_DATAMODELS_MANIFEST = yaml.safe_load(_DATAMODELS_MANIFEST_PATH.read_bytes())
+_DATAMODELS_MANIFEST = yaml.load(_DATAMODELS_MANIFEST_PATH.read_bytes(), Loader=SafeLoader)
 
 
 def _class_name_from_tag_uri(tag_uri):
@@ -519,7 +817,10 @@ def _class_name_from_tag_uri(tag_uri):
 
 
 def _class_from_tag(tag, docstring):
-    class_name = _class_name_from_tag_uri(tag["tag_uri"])
+    # Tags added to rad after the table was last generated are named here
+    class_name = _TAG_TO_CLASS_NAME.get(tag["tag_uri"])
+    if class_name is None:
+        class_name = _class_name_from_tag_uri(tag["tag_uri"])
 
     schema_uri = tag["schema_uri"]
     if "tagged_scalar" in schema_uri:
@@ -557,6 +858,15 @@ for tag in _DATAMODELS_MANIFEST["tags"]:
         _class_from_tag(tag, docstring)
 
 
+# The tags and types handled by each converter, frozen once all of the node
+# classes have been defined.
+_OBJECT_NODE_TAGS = tuple(_OBJECT_NODE_CLASSES_BY_TAG)
+_OBJECT_NODE_TYPES = tuple(_OBJECT_NODE_CLASSES_BY_TAG.values())
+_LIST_NODE_TAGS = tuple(_LIST_NODE_CLASSES_BY_TAG)
+_LIST_NODE_TYPES = tuple(_LIST_NODE_CLASSES_BY_TAG.values())
+_SCALAR_NODE_TAGS = tuple(_SCALAR_NODE_CLASSES_BY_TAG)
+_SCALAR_NODE_TYPES = tuple(_SCALAR_NODE_CLASSES_BY_TAG.values())
+
 # List of node classes made available by this library.  This is part
 # of the public API.
 NODE_CLASSES = (
@@ -38,8 +38,8 @@ def assert_node_equal(node1, node2):
         for value1, value2 in zip(node1, node2):
             _assert_value_equal(value1, value2)
     elif isinstance(node1, TaggedScalarNode):
-        value1 = node1.__class__.__bases__[0](node1)
-        value2 = node2.__class__.__bases__[0](node2)
+        value1 = node1._scalar_base(node1)
+        value2 = node2._scalar_base(node2)
 
         assert value1 == value2
     else:
@@ -5,7 +5,7 @@ Functions that support validation of model changes
 import warnings
 
 import jsonschema
-from asdf import AsdfFile
+from asdf import AsdfFile, block
 from asdf import schema as asdf_schema
 from asdf import yamlutil
 from asdf.util import HashableDict
@@ -53,23 +53,103 @@ def _check_type(validator, types, instance, schema):
 validator_callbacks = HashableDict(asdf_schema.YAML_VALIDATORS)
 validator_callbacks.update({"type": _check_type})
 
+_ASDF_SCHEMA = {"$schema": "http://stsci.edu/schemas/asdf-schema/0.1.0/asdf-schema"}
+
+
+class _IdentityCache:
+    """
+    A bounded cache of values keyed by the identity of an object, such as a
+    schema dict, that cannot be hashed, along with an optional hashable key.
+
+    Each entry holds a reference to its object so that the object's id
+    cannot be reused by another object while the entry is alive.  The cache
+    is emptied once it holds ``maxsize`` entries.
+    """
+
+    __slots__ = ("_entries", "maxsize")
+
+    def __init__(self, maxsize=1024):
+        self._entries = {}
+        self.maxsize = maxsize
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, obj, key=None, default=None):
+        """
+        Return the value cached for ``obj`` and ``key``, or ``default``.
+        """
+        entry = self._entries.get((id(obj), key))
+        if entry is not None and entry[0] is obj:
+            return entry[1]
+        return default
+
+    def set(self, obj, key, value):
+        """
+        Cache ``value`` for ``obj`` and ``key``, returning it.
+        """
+        if len(self._entries) >= self.maxsize:
+            self._entries.clear()
+        self._entries[(id(obj), key)] = (obj, value)
+        return value
+
+    def clear(self):
+        self._entries.clear()
+
+
+# Validators keyed by the schema and context they were built for
+_VALIDATOR_CACHE = _IdentityCache()
+
+_validator_context = None
+
+
+def _get_validator_context():
+    """
+    Return the `asdf.AsdfFile` shared by all validation in this package.
+    """
+    global _validator_context
+    if _validator_context is None:
+        _validator_context = AsdfFile()
+    return _validator_context
+
+
+def _get_validator(schema, ctx, validators=validator_callbacks):
+    """
+    Return a validator for ``schema``, building it only on the first request.
+    """
+    validator = _VALIDATOR_CACHE.get(schema, ctx)
+    if validator is None:
+        validator = _VALIDATOR_CACHE.set(schema, ctx, asdf_schema.get_validator(schema, ctx, validators=validators))
+    return validator
+
+
+def _release_blocks(ctx):
+    """
+    Drop the array blocks that converting values to their tagged form
+    registered with ``ctx``.  The shared context is never written, so the
+    blocks would only keep every validated array alive.
+    """
+    ctx._blocks = block.BlockManager(ctx)
+
 
 def _check_value(value):
     """
     Perform the actual validation.
     """
 
-    validator_context = AsdfFile()
+    validator_context = _get_validator_context()
 
     if hasattr(value, "_schema"):
         temp_schema = value._schema()
     else:
-        temp_schema = {"$schema": "http://stsci.edu/schemas/asdf-schema/0.1.0/asdf-schema"}
-    validator = asdf_schema.get_validator(temp_schema, validator_context, validators=validator_callbacks)
+        temp_schema = _ASDF_SCHEMA
+    validator = _get_validator(temp_schema, validator_context)
 
-    value = yamlutil.custom_tree_to_tagged_tree(value, validator_context)
-    validator.validate(value, _schema=temp_schema)
-    validator_context.close()
+    try:
+        value = yamlutil.custom_tree_to_tagged_tree(value, validator_context)
+        validator.validate(value)
+    finally:
+        _release_blocks(validator_context)
 
 
 def _error_message(path, error):
@@ -1,4 +1,6 @@
+import os
 import warnings
+import weakref
 
 import asdf
 import numpy as np
@@ -744,6 +746,13 @@ def test_crds_parameters(tmp_path):
 
     crds_pars = wfi_image.get_crds_parameters()
     assert "roman.meta.exposure.start_time" in crds_pars
+    assert "roman.data" not in crds_pars
+    assert all(isinstance(val, (str, int, float, complex, bool)) for val in crds_pars.values())
+
+    flat = wfi_image.to_flat_dict(include_arrays=False)
+    assert "roman.data" not in flat
+    assert flat["roman.meta.exposure.start_time"] == crds_pars["roman.meta.exposure.start_time"]
+    assert "roman.data" in wfi_image.to_flat_dict()
 
     utils.mk_ramp(filepath=file_path)
     ramp = datamodels.open(file_path)
@@ -764,3 +773,246 @@ def test_model_validate_without_save():
 
     with pytest.raises(ValidationError):
         m.validate()
+
+
+def test_model_items():
+    wfi_image = utils.mk_level2_image(shape=(8, 8))
+    model = datamodels.ImageModel(wfi_image)
+
+    items = dict(model.items())
+    assert items["meta.telescope"] == "ROMAN"
+    assert items["data"] is wfi_image.data
+    assert items["cal_logs.0"] == wfi_image.cal_logs[0]
+
+    # items are emitted in tree order
+    keys = [key for key, _ in model.items()]
+    assert keys.index("meta.telescope") < keys.index("data") < keys.index("cal_logs.0")
+
+
+def test_model_items_container_subclasses():
+    class CustomDict(dict):
+        pass
+
+    class CustomList(list):
+        pass
+
+    wfi_image = utils.mk_level2_image(shape=(8, 8))
+    wfi_image.meta["custom"] = CustomDict(a=1, b=CustomList([2, (3, 4)]))
+    items = dict(datamodels.ImageModel(wfi_image).items())
+
+    assert items["meta.custom.a"] == 1
+    assert items["meta.custom.b.0"] == 2
+    assert items["meta.custom.b.1.0"] == 3
+    assert items["meta.custom.b.1.1"] == 4
+
+
+def test_model_copy(tmp_path):
+    wfi_image = utils.mk_level2_image(shape=(8, 8))
+    model = datamodels.ImageModel(wfi_image)
+    model_copy = model.copy()
+
+    assert isinstance(model_copy, datamodels.ImageModel)
+    assert model_copy._instance is not model._instance
+    assert model_copy._asdf is not model._asdf
+    assert model_copy._asdf["roman"] is model_copy._instance
+    assert isinstance(model_copy._instance, stnode.WfiImage)
+    assert isinstance(model_copy.meta.instrument, stnode.WfiMode)
+
+    assert model_copy.data is not model.data
+    assert isinstance(model_copy.data, u.Quantity)
+    assert model_copy.data.unit == model.data.unit
+    np.testing.assert_array_equal(model_copy.data, model.data)
+    np.testing.assert_array_equal(model_copy.err, model.err)
+
+    model_copy.meta.filename = "copy.asdf"
+    model_copy.data[0, 0] = model.data[0, 0] + 1 * model.data.unit
+    assert model.meta.filename != "copy.asdf"
+    assert model.data[0, 0] != model_copy.data[0, 0]
+
+    file_path = model_copy.save(tmp_path / "copy.asdf")
+    with datamodels.open(file_path) as reopened:
+        assert reopened.meta.filename == "copy.asdf"
+        np.testing.assert_array_equal(reopened.data, model_copy.data)
+
+
+def test_model_schema_uri():
+    model = datamodels.ImageModel(utils.mk_level2_image(shape=(8, 8)))
+    assert model.schema_uri == "asdf://stsci.edu/datamodels/roman/schemas/wfi_image-1.0.0"
+
+    # the cached uri follows the wrapped node
+    model._instance = utils.mk_ramp(shape=(2, 8, 8))
+    assert model.schema_uri == "asdf://stsci.edu/datamodels/roman/schemas/ramp-1.0.0"
+
+
+def test_model_save_roundtrip(tmp_path):
+    file_path = tmp_path / "test_image.asdf"
+    utils.mk_level2_image(filepath=file_path, shape=(8, 8))
+
+    with datamodels.open(file_path) as model:
+        model.meta.filename = "roundtrip.asdf"
+        model.data[0, 0] = 42 * model.data.unit
+        file_path2 = tmp_path / "roundtrip.asdf"
+        model.save(file_path2)
+
+    with datamodels.open(file_path2) as model:
+        assert model.meta.filename == "roundtrip.asdf"
+        assert model.data[0, 0].value == 42
+
+
+def test_model_save_in_memory(tmp_path):
+    model = datamodels.ImageModel(utils.mk_level2_image(shape=(8, 8)))
+    model.meta.filename = "in_memory.asdf"
+    file_path = model.save(tmp_path / "in_memory.asdf")
+    # saving does not modify the model's own AsdfFile
+    assert model._asdf.uri is None
+
+    with datamodels.open(file_path) as reopened:
+        assert reopened.meta.filename == "in_memory.asdf"
+        np.testing.assert_array_equal(reopened.data, model.data)
+
+
+def test_model_type_mismatch(tmp_path):
+    file_path = tmp_path / "test_ramp.asdf"
+    utils.mk_ramp(filepath=file_path, shape=(2, 8, 8))
+
+    with datamodels.RampModel(file_path) as model:
+        assert isinstance(model._instance, stnode.Ramp)
+
+    with pytest.raises(ValueError, match=r"ASDF file is not of the type expected"):
+        datamodels.ImageModel(file_path)
+
+
+def test_model_attribute_forwarding():
+    wfi_image = utils.mk_level2_image(shape=(8, 8))
+    model = datamodels.ImageModel(wfi_image)
+
+    assert model.data is wfi_image.data
+    assert model.meta.telescope == "ROMAN"
+    assert not hasattr(model, "coeffs")
+    assert not hasattr(model, "__not_a_dunder__")
+
+    new_data = wfi_image.data.copy()
+    model.data = new_data
+    assert wfi_image.data is new_data
+
+
+def test_model_private_attributes():
+    model = datamodels.DataModel()
+    model._foo = 1
+    assert model._foo == 1
+
+    with pytest.raises(AttributeError):
+        setattr(model, "", 1)
+
+
+@pytest.mark.parametrize(
+    "model_class, node, array_name, shape",
+    [
+        (datamodels.ImageModel, utils.mk_level2_image(shape=(8, 8)), "data", (8, 8)),
+        (datamodels.LinearityRefModel, utils.mk_linearity(shape=(2, 8, 8)), "coeffs", (2, 8, 8)),
+        (datamodels.MaskRefModel, utils.mk_mask(shape=(8, 8)), "dq", (8, 8)),
+    ],
+)
+def test_model_primary_array(model_class, node, array_name, shape):
+    model = model_class(node)
+    assert model.get_primary_array_name() == array_name
+    assert model.shape == shape
+
+
+@pytest.mark.parametrize("path_type", [str, bytes, lambda path: path])
+def test_model_path_init(tmp_path, path_type):
+    file_path = tmp_path / "test_image.asdf"
+    utils.mk_level2_image(filepath=file_path, shape=(8, 8))
+
+    with datamodels.ImageModel(path_type(file_path)) as model:
+        assert model.meta.telescope == "ROMAN"
+
+
+def test_model_copy_shared_arrays():
+    wfi_image = utils.mk_level2_image(shape=(8, 8))
+    wfi_image.var_flat = wfi_image.var_rnoise
+    model_copy = datamodels.ImageModel(wfi_image).copy()
+
+    # arrays shared in the source tree are shared in the copy
+    assert model_copy.var_flat is model_copy.var_rnoise
+    assert model_copy.var_flat is not wfi_image.var_flat
+
+
+def test_model_lazy_asdf(capsys):
+    model = datamodels.ImageModel()
+    assert model._asdf is None
+
+    model._instance = utils.mk_level2_image(shape=(8, 8))
+    model.info(max_rows=200)
+    assert model._asdf["roman"] is model._instance
+    captured = capsys.readouterr()
+    assert "optical_element" in captured.out
+    model.close()
+
+
+@pytest.mark.parametrize("path", ["test.asdf", b"test.asdf", "test.ASDF", lambda filename: "test.asdf"])
+def test_model_save_path(tmp_path, path):
+    model = datamodels.ImageModel(utils.mk_level2_image(shape=(8, 8)))
+    output_path = model.save(path, dir_path=str(tmp_path))
+
+    assert os.path.dirname(output_path) == str(tmp_path)
+    assert os.path.basename(output_path).lower() == "test.asdf"
+    with datamodels.open(output_path) as reopened:
+        assert isinstance(reopened, datamodels.ImageModel)
+
+
+def test_model_save_unknown_extension(tmp_path):
+    model = datamodels.ImageModel(utils.mk_level2_image(shape=(8, 8)))
+    with pytest.raises(ValueError, match=r"unknown filetype .fits"):
+        model.save(tmp_path / "test.fits")
+
+
+def test_model_save_invalid(tmp_path):
+    file_path = tmp_path / "test_image.asdf"
+    utils.mk_level2_image(filepath=file_path, shape=(8, 8))
+
+    with datamodels.open(file_path) as model:
+        # invalidate the model without going through the node api
+        model.meta["telescope"] = "NOTROMAN"
+        with pytest.raises(ValidationError):
+            model.save(tmp_path / "invalid.asdf")
+
+
+def test_model_registry_registration(tmp_path, monkeypatch):
+    class WfiModeModel(datamodels.DataModel):
+        pass
+
+    file_path = tmp_path / "test_wfi_mode.asdf"
+    asdf.AsdfFile({"roman": stnode.WfiMode({"optical_element": "F129", "detector": "WFI18", "name": "WFI"})}).write_to(file_path)
+
+    monkeypatch.setitem(datamodels.model_registry, stnode.WfiMode, WfiModeModel)
+    with WfiModeModel(file_path) as model:
+        assert model.optical_element == "F129"
+    with datamodels.open(file_path) as model:
+        assert isinstance(model, WfiModeModel)
+
+
+def test_model_node_classes():
+    for node_class, model_class in datamodels.model_registry.items():
+        assert model_class._NODE_CLS is node_class
+    assert datamodels.DataModel._NODE_CLS is None
+
+
+def test_model_validation_releases_arrays():
+    """
+    Validating a model or an array assignment leaves no array blocks behind
+    in the shared validation context, which would keep the arrays alive.
+    """
+    model = datamodels.ImageModel(utils.mk_level2_image(shape=(8, 8)))
+    ctx = stnode.DNode.ctx
+    model.validate()
+    assert ctx._blocks._internal_blocks == []
+
+    data = model.data.copy()
+    ref = weakref.ref(data)
+    model.data = data
+    assert ctx._blocks._internal_blocks == []
+
+    model.data = model.data.copy()
+    del data
+    assert ref() is None
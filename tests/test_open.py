@@ -1,3 +1,4 @@
+import gc
 import warnings
 
 import asdf
@@ -205,3 +206,34 @@ def test_no_memmap(tmp_path, kwargs):
     with datamodels.open(file_path, mode="rw", **kwargs) as model:
         assert model.data[6, 19] != new_value
         assert (model.data == data).all()
+
+
+@pytest.mark.parametrize("memmap", [True, False])
+def test_model_init_memmap(tmp_path, memmap):
+    file_path = tmp_path / "test.asdf"
+    utils.mk_level2_image(filepath=file_path, shape=(8, 8))
+
+    with datamodels.ImageModel(file_path, memmap=memmap) as model:
+        # memory mapped arrays of a read-only file are not writeable
+        assert model.data.flags.writeable is not memmap
+
+
+def test_close_on_collect(tmp_path):
+    file_path = tmp_path / "test.asdf"
+    utils.mk_level2_image(filepath=file_path, shape=(8, 8))
+
+    model = datamodels.open(file_path)
+    af = model._asdf
+    assert not af._closed
+
+    # the file is closed once the model is garbage collected
+    del model
+    gc.collect()
+    assert af._closed
+
+    # but not when a copy of the model is collected
+    with datamodels.open(file_path) as model:
+        model_copy = datamodels.open(model)
+        del model_copy
+        gc.collect()
+        assert not model._asdf._closed
@@ -1,7 +1,13 @@
+import copy
+import gc
+import pickle
+import weakref
+
 import asdf
 import pytest
+from jsonschema import ValidationError
 
-from roman_datamodels import stnode
+from roman_datamodels import stnode, validate
 from roman_datamodels.testing import assert_node_equal, create_node
 
 
@@ -78,3 +84,355 @@ def test_schema_info():
             },
         }
     }
+
+
+def test_validator_cache():
+    """
+    Repeated assignments to the same attribute reuse one compiled validator,
+    and the cached validator still rejects invalid values.
+    """
+    node = stnode.WfiMode({"optical_element": "GRISM", "detector": "WFI18", "name": "WFI"})
+
+    node.optical_element = "PRISM"
+    cached = dict(stnode._VALIDATOR_CACHE._entries)
+    node.optical_element = "F129"
+    assert stnode._VALIDATOR_CACHE._entries == cached
+
+    with pytest.raises(ValidationError):
+        node.optical_element = "NOT_AN_ELEMENT"
+    assert node.optical_element == "F129"
+
+
+def test_schema_shared():
+    """
+    Instances of a tagged node class share one loaded schema.
+    """
+    node = stnode.WfiMode({"optical_element": "GRISM"})
+    other = stnode.WfiMode({"optical_element": "PRISM"})
+    assert node._schema() is other._schema()
+    assert node.get_schema() is node._schema()
+
+
+def test_dnode_nested_replaced():
+    """
+    Reads of nested nodes see values replaced through the raw dicts or
+    through another node wrapping the same dict.
+    """
+    node = stnode.DNode({"meta": {"exposure": {"a": 1}}})
+    assert node.meta.exposure.a == 1
+    node["meta"]["exposure"] = {"a": 2}
+    assert node.meta.exposure.a == 2
+
+    data = {"x": {"a": 1}}
+    first = stnode.DNode(data)
+    assert first.x.a == 1
+    stnode.DNode(data)["x"] = {"a": 2}
+    assert first.x.a == 2
+
+    del first["x"]
+    with pytest.raises(AttributeError):
+        first.x
+
+
+def test_dnode_no_reference_cycle():
+    """
+    Reading a nested node does not tie the parent into a reference cycle,
+    so dropping the parent frees its data without the cyclic collector.
+    """
+    data = {"meta": {"x": 1}}
+    node = stnode.DNode(data)
+    assert node.meta.x == 1
+    ref = weakref.ref(node)
+
+    gc.disable()
+    try:
+        del node
+        assert ref() is None
+    finally:
+        gc.enable()
+
+
+@pytest.mark.parametrize("value", [42, 4.2, True, None])
+def test_validate_plain_scalar(value):
+    """
+    Plain scalars skip the conversion to a tagged tree but are still checked
+    against the schema.
+    """
+    node = stnode.WfiMode({"optical_element": "GRISM"})
+    with pytest.raises(ValidationError):
+        node.optical_element = value
+    assert node.optical_element == "GRISM"
+
+
+def test_dnode_mapping():
+    """
+    The mapping protocol reads and writes through to the wrapped dict.
+    """
+    data = {"a": 1, "b": {"c": 2}}
+    node = stnode.DNode(data)
+    assert node["a"] == 1
+    assert "b" in node
+    assert "c" not in node
+    assert len(node) == 2
+    assert list(node) == ["a", "b"]
+    assert list(node.keys()) == ["a", "b"]
+    assert list(node.values()) == [1, {"c": 2}]
+    assert list(node.items()) == [("a", 1), ("b", {"c": 2})]
+    assert node.get("c") is None
+    assert node.get("c", 3) == 3
+    with pytest.raises(KeyError):
+        node["c"]
+
+    node.b["c"] = 4
+    assert data["b"]["c"] == 4
+
+
+@pytest.mark.parametrize(
+    "converter, classes_by_tag",
+    [
+        (stnode.TaggedObjectNodeConverter(), stnode._OBJECT_NODE_CLASSES_BY_TAG),
+        (stnode.TaggedListNodeConverter(), stnode._LIST_NODE_CLASSES_BY_TAG),
+        (stnode.TaggedScalarNodeConverter(), stnode._SCALAR_NODE_CLASSES_BY_TAG),
+    ],
+)
+def test_converter_tags(converter, classes_by_tag):
+    assert converter.tags == tuple(classes_by_tag)
+    assert converter.types == tuple(classes_by_tag.values())
+    for tag, node_class in classes_by_tag.items():
+        assert converter._class_for_tag(tag) is node_class
+
+
+def test_attribute_schema_combiners():
+    """
+    Assignments are validated against schemas found in combiners, and
+    attributes without a schema are not validated.
+    """
+    node = stnode.DNode({"a": 1, "b": 1})
+    node._x_schema = {"allOf": [{"properties": {"a": {"type": "integer"}}}]}
+
+    node.a = 2
+    with pytest.raises(ValidationError):
+        node.a = "two"
+    assert node.a == 2
+
+    node.b = "two"
+    assert node.b == "two"
+
+
+def test_shared_context():
+    """
+    All nodes share one AsdfFile context, stored as a plain class attribute
+    once it has been created.
+    """
+    node = stnode.WfiMode({"optical_element": "GRISM"})
+    ctx = node.ctx
+    assert isinstance(ctx, asdf.AsdfFile)
+    assert stnode.DNode.__dict__["ctx"] is ctx
+    assert stnode.TaggedScalarNode.ctx is ctx
+    assert stnode.FileDate("2020-01-01T00:00:00").ctx is ctx
+
+
+@pytest.mark.parametrize(
+    "schema, value",
+    [
+        ({"type": "integer"}, 1),
+        ({"type": "integer"}, 2.0),
+        ({"type": "integer"}, True),
+        ({"type": "number"}, True),
+        ({"type": "number", "minimum": 0, "exclusiveMinimum": True}, 0),
+        ({"type": "string", "enum": ["a", "b"]}, "a"),
+        ({"type": "string", "enum": ["a", "b"]}, "c"),
+        ({"type": "string", "pattern": "^[0-9]+$"}, "12a"),
+        ({"title": "Name", "type": "string", "maxLength": 2}, "abc"),
+        ({"type": "string", "minLength": 2}, "a"),
+        ({"type": ["number", "string"]}, None),
+        ({"maximum": 3}, 4),
+        ({"maximum": 3, "exclusiveMaximum": True}, 3),
+        ({"minimum": 3}, 1),
+        ({"minimum": 3}, True),
+        ({"maximum": 0}, False),
+    ],
+)
+def test_compiled_validator(schema, value):
+    """
+    Compiled validators accept and reject the same plain scalars as the asdf
+    validators, with the same errors.
+    """
+    pytest.importorskip("fastjsonschema")
+
+    validator = stnode._get_property_validator(schema, stnode.DNode.ctx)
+    assert validator.compiled is not None
+
+    try:
+        validator.validator.validate(value)
+    except ValidationError as expected:
+        with pytest.raises(ValidationError) as error:
+            stnode._check_value(value, schema, stnode.DNode.ctx)
+        assert str(error.value) == str(expected)
+    else:
+        stnode._check_value(value, schema, stnode.DNode.ctx)
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        {"tag": "asdf://stsci.edu/datamodels/roman/tags/file_date-1.0.0"},
+        {"type": "integer", "enum": [0, 1]},
+        {"anyOf": [{"type": "string"}, {"type": "null"}]},
+    ],
+)
+def test_compiled_validator_fallback(schema):
+    """
+    Schemas using keywords fastjsonschema would not check the same way are
+    left to the asdf validators.
+    """
+    assert stnode._get_property_validator(schema, stnode.DNode.ctx).compiled is None
+
+
+def test_dnode_setitem_scalar_keys():
+    """
+    Assigning a dict converts only the values stored under scalar node keys.
+    """
+    node = stnode.DNode({})
+    node["meta"] = {"telescope": "ROMAN", "other": "ROMAN"}
+    assert isinstance(node["meta"]["telescope"], stnode.Telescope)
+    assert node["meta"]["other"].__class__ is str
+
+
+def test_lnode_wrapper_cache():
+    """
+    Wrappers for container elements are reused until the element at that
+    index is replaced.
+    """
+    node = stnode.LNode([{"a": 1}, [1, 2], "scalar"])
+    first = node[0]
+    assert isinstance(first, stnode.DNode)
+    assert node[0] is first
+    assert node[1] is node[1]
+    assert node[2] == "scalar"
+
+    node[0] = {"a": 2}
+    assert node[0] is not first
+    assert node[0]["a"] == 2
+
+    node.insert(0, {"a": 3})
+    assert node[0]["a"] == 3
+    assert node[1]["a"] == 2
+
+    assert isinstance(node[:2], stnode.LNode)
+    assert list(node[:2][1]) == ["a"]
+
+
+def test_lnode_copy():
+    """
+    A shallow copy of a list node shares its elements but not their wrappers.
+    """
+    node = stnode.LNode([{"a": 1}])
+    wrapper = node[0]
+    node_copy = copy.copy(node)
+    assert node_copy.data == node.data
+    assert node_copy.data is not node.data
+    assert node_copy._wrappers == {}
+    assert node_copy[0] is not wrapper
+    assert node_copy[0]["a"] == 1
+    assert node[0] is wrapper
+
+
+def test_tag_to_class_name_table(manifest):
+    """
+    The generated class name table agrees with the names derived from the
+    manifest; regenerate it with ``scripts/gen_stnode_tables.py`` if not.
+    """
+    for tag in manifest["tags"]:
+        class_name = stnode._TAG_TO_CLASS_NAME.get(tag["tag_uri"])
+        if class_name is not None:
+            assert class_name == stnode._class_name_from_tag_uri(tag["tag_uri"])
+
+
+def test_dnode_slots():
+    """
+    Node state is kept in slots and survives copying and pickling.
+    """
+    parent = stnode.DNode({"child": {"a": 1}})
+    node = parent.child
+    assert set(node.__dict__) == set()
+    assert node._parent is parent
+    assert node._name == "child"
+
+    for other in (copy.copy(node), node.copy(), pickle.loads(pickle.dumps(node))):
+        assert other is not node
+        assert other._name == "child"
+        assert other["a"] == 1
+        assert other._data is not node._data
+
+
+@pytest.mark.parametrize("node_class", stnode._SCALAR_NODE_TYPES)
+def test_scalar_base(node_class):
+    assert node_class._scalar_base is node_class.__bases__[0]
+    assert node_class._scalar_base in (str, stnode.Time)
+
+
+def test_scalar_delegate_converter():
+    """
+    The converter used for FileDate values is looked up once per extension
+    manager.
+    """
+    converter = stnode.TaggedScalarNodeConverter()
+    ctx = asdf.AsdfFile()
+    time_converter = converter._get_delegate_converter(stnode.Time, ctx)
+    assert time_converter is ctx.extension_manager.get_converter_for_type(stnode.Time)
+    assert converter._get_delegate_converter(stnode.Time, ctx) is time_converter
+    assert list(converter._delegate_converters) == [ctx.extension_manager]
+
+
+def test_manifest_loaded(manifest):
+    assert stnode._DATAMODELS_MANIFEST == manifest
+
+
+def test_identity_cache():
+    """
+    The caches keyed by schema compare the schema by identity and stay
+    within their size limit.
+    """
+    cache = validate._IdentityCache(maxsize=2)
+    schema = {"type": "string"}
+    assert cache.set(schema, "a", None) is None
+    assert cache.get(schema, "a", stnode._MISSING) is None
+    assert cache.get(dict(schema), "a", stnode._MISSING) is stnode._MISSING
+    assert cache.get(schema, "b") is None
+
+    cache.set(schema, "b", 1)
+    cache.set(schema, "c", 2)
+    assert len(cache) == 1
+    assert cache.get(schema, "c") == 2
+
+    for schema_cache in (stnode._VALIDATOR_CACHE, stnode._PROPERTY_SCHEMA_CACHE, stnode._ATTRIBUTE_SCHEMA_CACHE):
+        assert schema_cache.maxsize == 1024
+
+
+def test_validator_built_on_demand():
+    """
+    The asdf validator for a schema is only built once a value needs it.
+    """
+    pytest.importorskip("fastjsonschema")
+
+    schema = {"type": "string"}
+    stnode._check_value("value", schema, stnode.DNode.ctx)
+    validator = stnode._get_property_validator(schema, stnode.DNode.ctx)
+    assert validator.compiled is not None
+    assert validator._validator is None
+
+    stnode._check_value(None, schema, stnode.DNode.ctx)
+    assert validator._validator is not None
+
+
+def test_dnode_getattr():
+    node = stnode.DNode({"a": None})
+    assert node.a is None
+    assert not hasattr(node, "b")
+    assert not hasattr(node, "_b")
+    assert not hasattr(node, "")
+
+
+def test_scalar_keys():
+    assert stnode._SCALAR_KEYS == set(stnode._SCALAR_NODE_CLASSES_BY_KEY)